@@ -0,0 +1,268 @@
+"""Inspect recent LangSmith traces for the PowerPoint agent.
+
+Diagnostic script for debugging agent runs recorded in LangSmith.
+Run it after exercising the agent (via test_agent.py or langgraph dev)
+to see what the model actually did on each turn and what arguments the
+create_presentation tool received.
+
+Both views push their predicates down to the LangSmith server: the
+tool-call view filters by run name and type server-side, and the
+recent-traces view requests only the fields it prints. That keeps the
+transferred payload small instead of pulling full runs and discarding
+most of them client-side.
+
+Requires LANGSMITH_API_KEY (and optionally LANGSMITH_PROJECT) in the
+environment or .env file.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import reprlib
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+PROJECT_NAME = os.environ.get("LANGSMITH_PROJECT", "ppt-agent")
+
+# Diagnostics (empty-result hints, fetch progress) go through a logger so
+# they cost nothing unless enabled; the report itself stays on stdout
+logger = logging.getLogger("ppt_agent.inspect_traces")
+logger.addHandler(logging.NullHandler())
+
+# Banner separators built once instead of re-allocated per section
+EQ80 = "=" * 80
+DASH80 = "-" * 80
+
+# Bound .format methods for the per-field lines - hoisted so the hot
+# report loops skip one f-string evaluation per emitted line
+_FIELD_FMT = "      {0}: {1}".format
+_SIZED_FIELD_FMT = "      {0} [{1} chars]: {2}".format
+
+# Truncating repr for field previews. Unlike str(value)[:200], reprlib never
+# materializes the full string of a large payload (e.g. a multi-MB
+# research_data blob) just to throw most of it away.
+_R = reprlib.Repr()
+_R.maxstring = 200
+_R.maxother = 200
+
+
+def _preview(value) -> str:
+    """Return a bounded preview of a run field without a full stringify."""
+    if isinstance(value, str):
+        return value[:200]
+    return _R.repr(value)
+
+
+def _size(value):
+    """Return len(value) when cheaply known, else None (never str-ifies)."""
+    if isinstance(value, (str, bytes, list, dict)):
+        return len(value)
+    return None
+
+# Reference time computed once at startup so both views share a single
+# consistent, reproducible time window. Timezone-aware UTC: LangSmith
+# filters expect UTC, and a naive datetime.now() gives ambiguous windows
+# on non-UTC hosts. All queries in one run use this same instant.
+_NOW = datetime.now(timezone.utc)
+
+# Only the fields the printers actually use — trimming the payload this way
+# avoids transferring large inputs/outputs blobs for runs we barely summarize
+_SELECT_FIELDS = ["id", "name", "start_time", "status", "inputs", "outputs", "run_type"]
+
+# Fetched runs keyed by the full query shape so repeated fetches within
+# one process (e.g. interactive use) skip the API entirely
+_RUNS_CACHE: dict[tuple, list] = {}
+
+
+@lru_cache(maxsize=1)
+def _client():
+    """Return the process-wide AsyncClient.
+
+    A single client means a single HTTP session: every query in the run
+    shares one connection pool instead of paying TCP+TLS setup per
+    caller. The langsmith import also stays off the module import path.
+    """
+    from langsmith import AsyncClient
+
+    return AsyncClient()
+
+
+async def _fetch_runs(
+    client,
+    hours: int = 2,
+    limit: int = 30,
+    run_filter: str | None = None,
+    run_type: str | None = None,
+) -> list:
+    """Fetch runs with predicates pushed down to the server, caching results.
+
+    Args:
+        client: Shared langsmith.AsyncClient instance
+        hours: How far back to look for runs
+        limit: Maximum number of runs to fetch
+        run_filter: Optional LangSmith filter DSL expression (e.g.
+            'eq(name, "create_presentation")') applied server-side
+        run_type: Optional run type ("tool", "llm", ...) applied server-side
+
+    Returns:
+        List of runs, newest first (LangSmith's default ordering)
+    """
+    key = (PROJECT_NAME, hours, limit, run_filter, run_type)
+    if key not in _RUNS_CACHE:
+        # No server-side limit: list_runs returns a lazy page iterator, so
+        # consuming it with an early exit keeps peak memory at O(page)
+        # rather than O(limit) and surfaces the first page immediately.
+        # Stopping early cancels any remaining page fetches.
+        kwargs = {
+            "project_name": PROJECT_NAME,
+            "start_time": _NOW - timedelta(hours=hours),
+            "select": _SELECT_FIELDS,
+        }
+        if run_filter is not None:
+            kwargs["filter"] = run_filter
+        if run_type is not None:
+            kwargs["run_type"] = run_type
+
+        runs = []
+        async for run in client.list_runs(**kwargs):
+            runs.append(run)
+            if len(runs) >= limit:
+                break
+        _RUNS_CACHE[key] = runs
+    return _RUNS_CACHE[key]
+
+
+async def _fetch_tool_calls(
+    client,
+    hours: int = 2,
+    scan_limit: int = 200,
+    max_matches: int = 30,
+) -> list:
+    """Fetch create_presentation runs, preferring server-side filtering.
+
+    Falls back to scanning the lazy run stream client-side when the SDK
+    does not support the filter DSL. The fallback stops as soon as
+    max_matches are found, so later result pages are never fetched or
+    parsed — the stream is consumed generator-style instead of being
+    materialized up front.
+    """
+    try:
+        return await _fetch_runs(
+            client,
+            hours=hours,
+            limit=max_matches,
+            run_filter='eq(name, "create_presentation")',
+            run_type="tool",
+        )
+    except TypeError:
+        # Older langsmith SDK without filter/run_type support
+        matches = []
+        async for run in client.list_runs(
+            project_name=PROJECT_NAME,
+            start_time=_NOW - timedelta(hours=hours),
+            limit=scan_limit,
+            select=_SELECT_FIELDS,
+        ):
+            if run.name == "create_presentation":
+                matches.append(run)
+                if len(matches) >= max_matches:
+                    break
+        return matches
+
+
+def inspect_recent_traces(runs: list, limit: int = 10, hours: int = 1):
+    """Show the most recent agent runs with their inputs and outputs.
+
+    Args:
+        runs: Pre-fetched runs to filter and display
+        limit: Maximum number of runs to display
+        hours: How far back to look within the pre-fetched window
+    """
+    buf = [EQ80, f"Recent traces (last {hours}h, limit {limit})", EQ80]
+
+    recent = runs[:limit]
+
+    for count, run in enumerate(recent, 1):
+        buf.append(f"\n[{count}] {run.name} ({run.run_type})")
+        buf.append(f"    id: {run.id}")
+        buf.append(f"    started: {run.start_time}")
+        buf.append(f"    status: {run.status}")
+
+        if run.inputs:
+            buf.append("    inputs:")
+            for key, value in run.inputs.items():
+                buf.append(_FIELD_FMT(key, _preview(value)))
+
+        if run.outputs:
+            buf.append("    outputs:")
+            for key, value in run.outputs.items():
+                buf.append(_FIELD_FMT(key, _preview(value)))
+
+    if not recent:
+        logger.warning("No runs found. Is LANGSMITH_TRACING enabled in your .env?")
+
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
+def find_presentation_tool_calls(runs: list):
+    """Find create_presentation tool calls and show the arguments they received.
+
+    Args:
+        runs: Pre-fetched runs to filter and display
+    """
+    buf = ["\n" + EQ80, "create_presentation tool calls", EQ80]
+
+    # Runs arrive pre-filtered by the server-side name/run_type predicates
+    matches = runs
+
+    for found, run in enumerate(matches, 1):
+        buf.append(f"\n[{found}] {run.name}")
+        buf.append(f"    started: {run.start_time}")
+        buf.append(f"    status: {run.status}")
+
+        if run.inputs:
+            buf.append("    arguments:")
+            for key, value in run.inputs.items():
+                preview = _preview(value)
+                if isinstance(value, (str, bytes)):
+                    buf.append(_SIZED_FIELD_FMT(key, _size(value), preview))
+                else:
+                    buf.append(_FIELD_FMT(key, preview))
+
+        if run.outputs:
+            buf.append("    result:")
+            for key, value in run.outputs.items():
+                buf.append(_FIELD_FMT(key, _preview(value)))
+
+    if not matches:
+        logger.warning("No create_presentation calls found in the window.")
+
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
+async def main():
+    """Run both pushed-down queries concurrently, then render the views."""
+    client = _client()
+    recent, tool_calls = await asyncio.gather(
+        _fetch_runs(client, hours=1, limit=10),
+        _fetch_tool_calls(client, hours=2, max_matches=30),
+    )
+
+    inspect_recent_traces(recent, limit=10, hours=1)
+    find_presentation_tool_calls(tool_calls)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect LangSmith traces for the PowerPoint agent")
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Show diagnostic hints (empty-result warnings, fetch info)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    asyncio.run(main())
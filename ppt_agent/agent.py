@@ -10,28 +10,35 @@ execution and state management.
 Environment variables are loaded from .env file in the project root.
 """
 
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
-from langchain.agents import create_agent
-from langgraph.checkpoint.memory import MemorySaver
+
+# Library logger: silent by default (NullHandler), so importing the agent
+# performs no stdout/stderr IO; applications opt in via logging config
+logger = logging.getLogger("ppt_agent")
+logger.addHandler(logging.NullHandler())
 
 # Import progressive disclosure skill loader and presentation tools
 from ppt_agent.skills import load_skill
+from ppt_agent.subagents import research_subagent_batch_tool, research_subagent_tool
 from ppt_agent.utils.tools import create_presentation, list_presentations
 
 
 # Load environment variables from .env file
 # Look for .env in project root (parent of ppt_agent directory)
+# NOTE: Intentionally silent on import - status is reported in the
+# __main__ banner instead, so importing the module costs no stdout IO
 project_root = Path(__file__).parent.parent
 env_path = project_root / ".env"
 
 if env_path.exists():
     load_dotenv(dotenv_path=env_path)
-    print(f"✓ Loaded environment variables from: {env_path}")
+    logger.info("Loaded environment variables from %s", env_path)
 else:
-    print(f"⚠ Warning: .env file not found at {env_path}")
-    print("  Create .env file from .env.template and add your API keys")
+    logger.warning(".env file not found at %s", env_path)
 
 
 # System prompt that defines the agent's role and behavior
@@ -49,6 +56,14 @@ SYSTEM_PROMPT = """You are a helpful AI assistant with access to specialized ski
 You have access to skills through the load_skill tool. When a user asks for something specific
 (like creating presentations), load the appropriate skill first to gain specialized expertise.
 
+## Research
+
+Before creating a presentation on a factual topic, use the research_subagent_tool to gather
+current facts and statistics, then pass the findings along so slides contain real content.
+When you need research on several subtopics, call research_subagent_batch_tool once with all
+the queries instead of researching them one at a time - the batch covers every topic in a
+single sub-agent round-trip.
+
 ## Progressive Disclosure
 
 Skills are loaded on-demand to keep your context focused. Only load skills when you need them,
@@ -57,6 +72,18 @@ and they will provide you with specialized prompts and capabilities.
 Be professional, helpful, and proactive in loading skills when tasks require specialized knowledge."""
 
 
+# Single immutable tool registry shared by every graph build. Tool schema
+# introspection happens once per tool object, so all consumers must reuse
+# these instances rather than constructing their own lists.
+TOOLS = (
+    load_skill,
+    research_subagent_tool,
+    research_subagent_batch_tool,
+    create_presentation,
+    list_presentations,
+)
+
+
 # Create the agent using create_agent function from LangChain 1.1+
 # This returns a compiled StateGraph that can be used with LangGraph deployment
 #
@@ -69,11 +96,25 @@ Be professional, helpful, and proactive in loading skills when tasks require spe
 #
 # NOTE: No checkpointer needed - LangGraph API handles persistence automatically
 # For local testing without langgraph dev, you can add: checkpointer=MemorySaver()
-graph = create_agent(
-    model="gpt-5-nano",  # Using cost-effective GPT-5 nano model
-    tools=[load_skill, create_presentation, list_presentations],
-    system_prompt=SYSTEM_PROMPT,
-)
+@lru_cache(maxsize=1)
+def build_graph():
+    """Build the agent graph exactly once per process.
+
+    Memoized so every import path (langgraph.json, tests, scripts) shares
+    the same compiled StateGraph instead of recompiling it. create_agent
+    is imported here so the langchain.agents subtree only loads when the
+    graph is actually built.
+    """
+    from langchain.agents import create_agent
+
+    return create_agent(
+        model="gpt-5-nano",  # Using cost-effective GPT-5 nano model
+        tools=list(TOOLS),  # create_agent expects a list
+        system_prompt=SYSTEM_PROMPT,
+    )
+
+
+graph = build_graph()
 
 
 # Optional: Test the agent structure when run directly
@@ -82,11 +123,17 @@ if __name__ == "__main__":
     print("PowerPoint Agent Configuration")
     print("=" * 70)
     print(f"Model: gpt-5-nano")
-    print(f"Environment: {'Loaded from .env' if env_path.exists() else 'No .env found'}")
+    if env_path.exists():
+        print(f"Environment: Loaded from {env_path}")
+    else:
+        print(f"⚠ Warning: .env file not found at {env_path}")
+        print("  Create .env file from .env.template and add your API keys")
     print(f"\nTools (Progressive Disclosure Pattern):")
     print(f"  1. load_skill - Gateway to specialized skills")
-    print(f"  2. create_presentation - Creates PowerPoint files")
-    print(f"  3. list_presentations - Lists created files")
+    print(f"  2. research_subagent_tool - Web research via Tavily sub-agent")
+    print(f"  3. research_subagent_batch_tool - Multi-query research in one round-trip")
+    print(f"  4. create_presentation - Creates PowerPoint files")
+    print(f"  5. list_presentations - Lists created files")
     print(f"\nPersistence: Managed by LangGraph API")
     print("=" * 70)
     print("\n✓ Agent created successfully using LangChain's create_agent function")
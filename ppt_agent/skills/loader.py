@@ -5,16 +5,43 @@ specialized skills. The actual skill implementations are stored in
 external files and loaded on-demand, keeping the agent's context lean.
 """
 
+import asyncio
+from functools import lru_cache
 from pathlib import Path
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 # Path to skill definitions and scripts
 SKILLS_DIR = Path(__file__).parent / "definitions"
 SCRIPTS_DIR = Path(__file__).parent / "scripts"
 
+# Skill definitions are immutable for the lifetime of a process, so the
+# directory is scanned once at import and file reads are cached below
+AVAILABLE_SKILLS = tuple(sorted(f.stem for f in SKILLS_DIR.glob("*.txt")))
 
-@tool
-def load_skill(skill_name: str) -> str:
+
+@lru_cache(maxsize=32)
+def _read_skill(skill_name: str) -> str | None:
+    """Read a skill definition from disk, caching it for repeat loads.
+
+    Returns None when the skill does not exist. Call
+    _read_skill.cache_clear() in tests that rewrite skill files.
+    """
+    skill_file = SKILLS_DIR / f"{skill_name}.txt"
+    if not skill_file.exists():
+        return None
+    return skill_file.read_text()
+
+
+def _miss_message(skill_name: str) -> str:
+    """Build the not-found message from the precomputed skills list."""
+    return (
+        f"Skill '{skill_name}' not found.\n\n"
+        f"Available skills: {', '.join(AVAILABLE_SKILLS)}\n\n"
+        f"Use load_skill with one of these names to activate that skill."
+    )
+
+
+def _load_skill(skill_name: str) -> str:
     """Load a specialized skill prompt and make its capabilities available.
 
     This tool implements progressive disclosure - skills are loaded on-demand
@@ -31,16 +58,34 @@ def load_skill(skill_name: str) -> str:
     Returns:
         The skill's specialized prompt, context, and available tools
     """
-    skill_file = SKILLS_DIR / f"{skill_name}.txt"
+    # Cached read - skill files are only hit on the first load
+    skill_content = _read_skill(skill_name)
+
+    if skill_content is None:
+        return _miss_message(skill_name)
+
+    return skill_content
+
+
+async def _aload_skill(skill_name: str) -> str:
+    """Async variant of _load_skill.
+
+    Offloads the (cold-cache) file read to a worker thread so the ASGI
+    event loop running the agent is never blocked on disk IO.
+    """
+    skill_content = await asyncio.to_thread(_read_skill, skill_name)
+
+    if skill_content is None:
+        return _miss_message(skill_name)
 
-    if not skill_file.exists():
-        available = [f.stem for f in SKILLS_DIR.glob("*.txt")]
-        return (
-            f"Skill '{skill_name}' not found.\n\n"
-            f"Available skills: {', '.join(available)}\n\n"
-            f"Use load_skill with one of these names to activate that skill."
-        )
-
-    # Load the skill's specialized prompt from external file
-    skill_content = skill_file.read_text()
     return skill_content
+
+
+# Register both implementations on one tool: LangChain invokes the
+# coroutine when the agent runs inside an event loop, the sync function
+# otherwise
+load_skill = StructuredTool.from_function(
+    func=_load_skill,
+    coroutine=_aload_skill,
+    name="load_skill",
+)
@@ -0,0 +1,217 @@
+"""Research-text parsing helpers - executed outside agent context.
+
+Pure-Python hot path for turning research markdown into chartable data.
+Isolated in its own module so the slide-building code in
+create_presentation.py stays focused on python-pptx work, and so this
+glue layer could later be swapped for a compiled build without touching
+its callers.
+"""
+
+import re
+
+# Compiled once: each pattern replaces a chain of per-line str.replace /
+# startswith calls with a single C-level scan
+_BULLET_RE = re.compile(r"^(?:[-*]|•)\s+")
+_SKIP_RE = re.compile(r"^(?:#|https?://)")
+_BOLD_RE = re.compile(r"\*\*")
+
+# Section titles to drop from bullet content, with or without a leading
+# markdown header prefix ("## Sources" and bare "Sources" both match).
+# Case-insensitive matching happens inside the regex engine, so no
+# per-line lowercased copy is allocated just to run the prefix checks;
+# the named group flags the title that opens the Visual Suggestions
+# section
+_SKIP_TITLE_RE = re.compile(
+    r"^(?:#{1,6}\s*)?(?:key findings|(?P<vs>visual suggestions)|sources|key insight)",
+    re.IGNORECASE,
+)
+
+# Sentinel distinguishing "caller did not scan for a suggestion" from
+# "caller scanned and found none" in parse_research_for_visuals
+_UNSET = object()
+
+# Numeric-fact patterns used for chart extraction, merged into a single
+# alternation so one scan of the text covers all four shapes. Compiled
+# once at module scope so each call skips the re-cache probe
+_PAT_NUMERIC = re.compile(
+    r"(?P<medal_label>[A-Z][A-Za-z\s&]+):\s*(?P<medal_value>\d+)\s*(?:total\s+)?medals?"
+    r"|(?P<gsb_label>gold|silver|bronze)\s*[:\-]\s*(?P<gsb_value>\d+)"
+    r"|(?P<stat_value>[\d,]+)\s+(?P<stat_label>athletes|countries|events|sports|participants)"
+    r"|(?P<year>(?:19|20)\d{2})\s*[:\-]\s*(?P<year_value>[\d,]+)",
+    re.IGNORECASE,
+)
+
+# Cheap prefilter gating the full numeric-fact scan: if none of these
+# literals appear, _PAT_NUMERIC cannot produce chartable data either,
+# so one fast linear probe replaces the multi-branch NFA pass
+_TRIGGER_RE = re.compile(
+    r"medals?|gold|silver|bronze"
+    r"|[\d,]+\s+(?:athletes|countries|events|sports|participants)"
+    r"|(?:19|20)\d{2}\s*[:\-]",
+    re.IGNORECASE,
+)
+
+# Token sets for label classification - set intersection against split
+# tokens instead of substring probes over repeatedly lowered strings
+_MEDAL_WORDS = frozenset({"gold", "silver", "bronze"})
+
+
+def extract_numbers_from_text(text: str) -> list:
+    """Pull (label, value) pairs suitable for charting out of research text.
+
+    Scans for the numeric-fact shapes the research sub-agent commonly
+    produces: per-entity medal counts, gold/silver/bronze breakdowns,
+    headline statistics, and year/value series.
+
+    Args:
+        text: Raw research text to scan
+
+    Returns:
+        List of (label, int value) tuples, deduplicated by label,
+        capped at 8 entries
+    """
+    chart_data = []
+
+    # Scan a bold-stripped copy: the sub-agent typically bolds entity
+    # labels ("- **United States**: 126 total medals"), and the ** would
+    # otherwise keep the label branch from matching at all
+    text = _BOLD_RE.sub("", text)
+
+    # One pass over the text; per-branch counters preserve the old
+    # 10-matches-per-pattern cap without four separate findall scans
+    medals = gsb = stats = years = 0
+    for m in _PAT_NUMERIC.finditer(text):
+        if m.group("medal_label") is not None:
+            if medals < 10:
+                chart_data.append((m.group("medal_label").strip(), int(m.group("medal_value"))))
+                medals += 1
+        elif m.group("gsb_label") is not None:
+            if gsb < 10:
+                chart_data.append((m.group("gsb_label").capitalize(), int(m.group("gsb_value"))))
+                gsb += 1
+        elif m.group("stat_label") is not None:
+            if stats < 10:
+                chart_data.append(
+                    (m.group("stat_label").capitalize(), int(m.group("stat_value").replace(",", "")))
+                )
+                stats += 1
+        elif years < 10:
+            chart_data.append((m.group("year"), int(m.group("year_value").replace(",", ""))))
+            years += 1
+
+    # Drop zero values and duplicate labels, keeping first occurrence.
+    # dicts preserve insertion order, so one container does both the
+    # dedup probe and the ordered accumulation
+    out = {}
+    for label, value in chart_data:
+        if value > 0 and label not in out:
+            out[label] = value
+
+    return list(out.items())[:8]
+
+
+def scan_research(lines: list) -> tuple:
+    """Classify research lines into slide bullets and a visual suggestion.
+
+    Single traversal doing the work of two scans: each line is stripped,
+    cleaned, and routed to the bullet list or captured as the chart-title
+    suggestion (the first content line after a "Visual Suggestions"
+    section title). Markers and bold markup are stripped in the same pass.
+
+    Args:
+        lines: Research markdown already split into lines
+
+    Returns:
+        (bullets, suggestion) tuple: cleaned bullet strings in source
+        order, and the suggestion line or None
+    """
+    bullets = []
+    suggestion = None
+    awaiting_suggestion = False
+    for raw in lines:
+        # Strip exactly once: the bullet pattern consumes the marker's
+        # trailing whitespace, so the cleaned line needs no re-strip
+        line = raw.strip()
+        if not line:
+            continue
+        # Strip the bullet marker before the header/link filter runs, or
+        # bulleted source links ("- https://...") slip through as content
+        cleaned = _BULLET_RE.sub("", line, count=1)
+        # Section titles first: they commonly arrive as markdown headers
+        # ("## Visual Suggestions"), which the blanket "#" skip below
+        # would otherwise consume before the title state machine sees
+        # them. Any other section title closes an open suggestion wait,
+        # so an empty Visual Suggestions section never captures a line
+        # from the section that follows it
+        title_match = _SKIP_TITLE_RE.match(cleaned)
+        if title_match:
+            awaiting_suggestion = title_match.lastgroup == "vs" and suggestion is None
+            continue
+        if _SKIP_RE.match(cleaned):
+            continue
+        cleaned = _BOLD_RE.sub("", cleaned)
+        if not cleaned:
+            continue
+        if awaiting_suggestion:
+            # The suggestion line is a chart-title hint, not slide content
+            suggestion = cleaned
+            awaiting_suggestion = False
+            continue
+        bullets.append(cleaned)
+    return bullets, suggestion
+
+
+def parse_research_for_visuals(
+    research_data: str, lines: list | None = None, suggestion=_UNSET
+) -> dict:
+    """Decide which data-driven visual slides the research supports.
+
+    Args:
+        research_data: Markdown findings from the research sub-agent
+        lines: Optional pre-split research lines; pass them when the
+            caller has already split research_data to avoid a second
+            full traversal of the text
+        suggestion: Chart-title suggestion already found by scan_research
+            (None counts as "scanned, nothing found"); when omitted the
+            lines are scanned here instead
+
+    Returns:
+        Dictionary with "chart_type" ("pie"/"bar"/None), "chart_title",
+        "chart_data" (label/value pairs), and "table_rows" (set instead
+        of chart_data when there are too many categories to chart well)
+    """
+    visuals = {"chart_type": None, "chart_title": None, "chart_data": [], "table_rows": []}
+    if not research_data:
+        return visuals
+
+    # Most non-statistical research has none of the trigger shapes; bail
+    # before the expensive extraction pass and line scan
+    if not _TRIGGER_RE.search(research_data):
+        return visuals
+
+    chart_data = extract_numbers_from_text(research_data)
+    if not chart_data:
+        return visuals
+
+    # Pick up an explicit "Visual Suggestions" section title if present,
+    # unless the caller already ran scan_research and handed us the result
+    if suggestion is _UNSET:
+        if lines is None:
+            lines = research_data.splitlines()
+        _, suggestion = scan_research(lines)
+
+    # Wide category sets read better as a table than a crowded chart
+    if len(chart_data) > 6:
+        visuals["table_rows"] = chart_data
+        visuals["chart_title"] = suggestion or "Data Overview"
+        return visuals
+
+    # Medal-type breakdowns are part-of-whole data - use a pie; anything
+    # dominated by headline statistics charts better as bars
+    is_medal_breakdown = all(
+        _MEDAL_WORDS.intersection(label.lower().split()) for label, _ in chart_data
+    )
+    visuals["chart_type"] = "pie" if is_medal_breakdown else "bar"
+    visuals["chart_title"] = suggestion or "Key Figures"
+    visuals["chart_data"] = chart_data
+    return visuals
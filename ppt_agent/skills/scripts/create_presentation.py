@@ -5,17 +5,148 @@ PowerPoint presentations. It is called by the tool but its code
 never enters the agent's context window (progressive disclosure).
 """
 
+import io
+import logging
 import os
+import re
 from datetime import datetime
+from xml.sax.saxutils import escape
+
 from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
 from pptx.util import Inches
 
+# Diagnostics go through a logger so the slide-building loop does no
+# stderr IO unless debug logging is enabled; %-style args defer string
+# formatting to the same gate
+logger = logging.getLogger("ppt_agent.create_presentation")
+logger.addHandler(logging.NullHandler())
+
+# Text parsing lives in its own module (pure-Python hot path, no pptx
+# dependency) so the chart/table extraction can evolve independently
+from ppt_agent.skills.scripts._parsing import parse_research_for_visuals, scan_research
+
+# Filename sanitizer: every char that is not word/whitespace becomes "_"
+_UNSAFE_RE = re.compile(r"[^\w\s]")
+
+# Directories already ensured this process - saves a stat/mkdir syscall
+# per call when a service writes many decks into the same output_dir
+_DIR_CACHE: set = set()
+
+
+# Chart geometry per chart type, converted to EMU once at import instead
+# of re-running the Inches arithmetic on every chart slide
+_CHART_GEOMETRY = {
+    XL_CHART_TYPE.COLUMN_CLUSTERED: (Inches(1), Inches(1.5), Inches(8), Inches(5.5)),
+    XL_CHART_TYPE.PIE: (Inches(2), Inches(1.5), Inches(6), Inches(5.5)),
+}
+
+
+def _add_chart_slide(prs, title: str, chart_data: list, chart_type):
+    """Add a slide holding one chart of the given type built from chart_data.
+
+    Shared path for every chart shape: one CategoryChartData populated
+    with a single pass over chart_data, then one add_chart call. The
+    label/value columns come from the same zip traversal instead of two
+    separate comprehensions.
+    """
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = title
+
+    labels, values = zip(*chart_data)
+    data = CategoryChartData()
+    data.categories = labels
+    data.add_series("Values", values)
+
+    x, y, cx, cy = _CHART_GEOMETRY[chart_type]
+    slide.shapes.add_chart(chart_type, x, y, cx, cy, data)
+
+
+def create_bar_chart_slide(prs, title: str, chart_data: list):
+    """Add a slide with a clustered-column chart built from chart_data."""
+    _add_chart_slide(prs, title, chart_data, XL_CHART_TYPE.COLUMN_CLUSTERED)
+
+
+def create_pie_chart_slide(prs, title: str, chart_data: list):
+    """Add a slide with a pie chart built from chart_data."""
+    _add_chart_slide(prs, title, chart_data, XL_CHART_TYPE.PIE)
+
+
+# Prebuilt cell text bodies: assigning cell.text tears down and rebuilds
+# the a:txBody subtree through _Paragraph/_Run objects per cell; parsing
+# a filled-in template string skips all of that Python-object churn
+_CELL_TMPL = (
+    '<a:txBody xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    "<a:bodyPr/><a:lstStyle/><a:p><a:r><a:t>{}</a:t></a:r></a:p></a:txBody>"
+)
+_HEADER_CELL_TMPL = (
+    '<a:txBody xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    '<a:bodyPr/><a:lstStyle/><a:p><a:r><a:rPr b="1"/><a:t>{}</a:t></a:r></a:p></a:txBody>'
+)
+
+
+def _set_cell_text(cell, value, tmpl=_CELL_TMPL):
+    """Set a table cell's text by swapping in a pre-templated a:txBody."""
+    tc = cell._tc
+    tc.replace(tc.find(qn("a:txBody")), parse_xml(tmpl.format(escape(str(value)))))
+
+
+def create_table_slide(prs, title: str, rows: list):
+    """Add a slide with a two-column label/value table."""
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = title
+
+    table_shape = slide.shapes.add_table(
+        len(rows) + 1, 2, Inches(2), Inches(1.5), Inches(6), Inches(0.4) * (len(rows) + 1)
+    )
+    table = table_shape.table
+    _set_cell_text(table.cell(0, 0), "Item", _HEADER_CELL_TMPL)
+    _set_cell_text(table.cell(0, 1), "Value", _HEADER_CELL_TMPL)
+    for r, (label, value) in enumerate(rows, 1):
+        _set_cell_text(table.cell(r, 0), label)
+        _set_cell_text(table.cell(r, 1), value)
+
+
+def _append_paragraphs(text_frame, texts, level: int = 1):
+    """Append bullet paragraphs to a text frame in one DOM extend.
+
+    text_frame.add_paragraph() walks and mutates the underlying XML tree
+    once per bullet. This builds every <a:p> element up front and grafts
+    them onto the <a:txBody> with a single extend() call.
+
+    Args:
+        text_frame: python-pptx text frame to append to
+        texts: Iterable of paragraph strings
+        level: Indent level for the appended paragraphs
+    """
+    txBody = text_frame._txBody
+    a_p, a_pPr, a_r, a_t = qn("a:p"), qn("a:pPr"), qn("a:r"), qn("a:t")
+
+    elems = []
+    for text in texts:
+        p = txBody.makeelement(a_p, {})
+        if level:
+            p.append(p.makeelement(a_pPr, {"lvl": str(level)}))
+        r = p.makeelement(a_r, {})
+        t = r.makeelement(a_t, {})
+        t.text = text
+        r.append(t)
+        p.append(r)
+        elems.append(p)
+
+    txBody.extend(elems)
+
 
 def create_powerpoint(
     topic: str,
     num_slides: int = 5,
     include_title_slide: bool = True,
     output_dir: str = "./output",
+    research_data: str | None = None,
+    output_stream=None,
 ) -> dict:
     """Create a PowerPoint presentation.
 
@@ -27,6 +158,11 @@ def create_powerpoint(
         num_slides: Number of content slides (excluding title)
         include_title_slide: Whether to include a title slide
         output_dir: Directory to save the file
+        research_data: Optional markdown research findings (from the
+            research sub-agent) to turn into slide bullet content
+        output_stream: Optional writable binary stream. When given, the
+            .pptx is written there and the disk round-trip (directory
+            creation, filename generation) is skipped entirely
 
     Returns:
         Dictionary with success status, filepath, and message
@@ -47,8 +183,20 @@ def create_powerpoint(
                 "filepath": None,
             }
 
-        # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
+        # One clock read per invocation - the subtitle and the filename
+        # share the same instant (and can no longer straddle midnight)
+        now = datetime.now()
+        generated_on = now.strftime("%B %d, %Y")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+        # Split the research markdown once, then one scan_research pass
+        # yields both the slide bullets and the chart-title suggestion -
+        # the visuals block below reuses the suggestion instead of
+        # re-walking the lines
+        research_lines = research_data.splitlines() if research_data else []
+        research_bullets, visual_suggestion = (
+            scan_research(research_lines) if research_lines else ([], None)
+        )
 
         # Create presentation
         prs = Presentation()
@@ -63,13 +211,28 @@ def create_powerpoint(
             subtitle = slide.placeholders[1]
 
             title.text = topic
-            subtitle.text = f"Generated on {datetime.now().strftime('%B %d, %Y')}"
+            subtitle.text = (
+                f"Generated on {generated_on}"
+                f"{' | Research-Enhanced Presentation' if research_data else ''}"
+            )
 
         # Add content slides
+        # Loop invariants hoisted: python-pptx attribute access walks the
+        # XML tree, so bind what we can outside the per-slide loop
         bullet_slide_layout = prs.slide_layouts[1]
+        add_slide = prs.slides.add_slide
+        bullets_per_slide = (
+            max(3, len(research_bullets) // num_slides) if research_bullets else 0
+        )
+        # Precomputed (start, end) index spans per slide - bullets are read
+        # by index below, so no per-slide list copies are sliced off
+        slide_spans = [
+            (k * bullets_per_slide, min((k + 1) * bullets_per_slide, len(research_bullets)))
+            for k in range(num_slides)
+        ]
 
         for i in range(1, num_slides + 1):
-            slide = prs.slides.add_slide(bullet_slide_layout)
+            slide = add_slide(bullet_slide_layout)
             shapes = slide.shapes
 
             # Set title
@@ -79,25 +242,82 @@ def create_powerpoint(
             # Add content
             body_shape = shapes.placeholders[1]
             text_frame = body_shape.text_frame
-            text_frame.text = f"Key concept {i} related to {topic}"
-
-            # Add bullet points
-            for j in range(3):
-                p = text_frame.add_paragraph()
-                p.text = f"Supporting detail {j + 1} for concept {i}"
-                p.level = 1
-
-        # Generate filename
-        safe_topic = "".join(c if c.isalnum() or c.isspace() else "_" for c in topic)
-        safe_topic = safe_topic.replace(" ", "_")[:50]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+            if research_bullets:
+                # Distribute research findings across the content slides
+                start_idx, end_idx = slide_spans[i - 1]
+
+                if start_idx < end_idx:
+                    text_frame.text = research_bullets[start_idx]
+                    _append_paragraphs(
+                        text_frame,
+                        (research_bullets[k] for k in range(start_idx + 1, end_idx)),
+                    )
+                else:
+                    text_frame.text = f"Key concept {i} related to {topic}"
+            else:
+                text_frame.text = f"Key concept {i} related to {topic}"
+
+                # Add bullet points
+                _append_paragraphs(
+                    text_frame,
+                    (f"Supporting detail {j + 1} for concept {i}" for j in range(3)),
+                )
+
+        # Add data-driven visual slides when the research contains
+        # chartable numbers
+        visual_slides = 0
+        if research_data:
+            visuals = parse_research_for_visuals(research_data, suggestion=visual_suggestion)
+            if visuals["table_rows"]:
+                logger.debug("Adding table slide with %d rows", len(visuals["table_rows"]))
+                create_table_slide(prs, visuals["chart_title"], visuals["table_rows"])
+                visual_slides = 1
+            elif visuals["chart_data"]:
+                logger.debug(
+                    "Adding %s chart slide (%d categories)",
+                    visuals["chart_type"],
+                    len(visuals["chart_data"]),
+                )
+                if visuals["chart_type"] == "pie":
+                    create_pie_chart_slide(prs, visuals["chart_title"], visuals["chart_data"])
+                else:
+                    create_bar_chart_slide(prs, visuals["chart_title"], visuals["chart_data"])
+                visual_slides = 1
+
+        total_slides = num_slides + visual_slides + (1 if include_title_slide else 0)
+
+        # Streaming callers get the bytes directly - no directory, no
+        # filename munging, no second copy through the page cache
+        if output_stream is not None:
+            prs.save(output_stream)
+            return {
+                "success": True,
+                "filepath": None,
+                "total_slides": total_slides,
+                "message": f"PowerPoint presentation written to stream (Total slides: {total_slides})",
+            }
+
+        # Create output directory (once per directory per process)
+        if output_dir not in _DIR_CACHE:
+            os.makedirs(output_dir, exist_ok=True)
+            _DIR_CACHE.add(output_dir)
+
+        # Generate filename (single C-level regex pass over the topic)
+        safe_topic = _UNSAFE_RE.sub("_", topic).replace(" ", "_")[:50]
         filename = f"{safe_topic}_{timestamp}.pptx"
         filepath = os.path.join(output_dir, filename)
 
-        # Save presentation
-        prs.save(filepath)
-
-        total_slides = num_slides + (1 if include_title_slide else 0)
+        # Save presentation: serialize to an in-memory buffer, then write
+        # the whole .pptx with a single os.write instead of the many small
+        # buffered writes zipfile issues when saving straight to a path
+        buf = io.BytesIO()
+        prs.save(buf)
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            os.write(fd, buf.getbuffer())
+        finally:
+            os.close(fd)
 
         return {
             "success": True,
@@ -28,26 +28,37 @@ def list_presentations(output_dir: str = "./output") -> dict:
                 "message": f"Output directory does not exist: {output_dir}",
             }
 
-        pptx_files = [f for f in os.listdir(output_dir) if f.endswith(".pptx")]
+        # scandir batches directory reads and caches stat results on each
+        # DirEntry, so listing N files costs one readdir pass instead of
+        # one extra stat() syscall per file
+        with os.scandir(output_dir) as it:
+            entries = [e for e in it if e.name.endswith(".pptx") and e.is_file()]
 
-        if not pptx_files:
+        if not entries:
             return {
                 "success": True,
                 "presentations": [],
                 "message": f"No PowerPoint presentations found in {output_dir}",
             }
 
-        presentations = []
-        for filename in sorted(pptx_files):
-            filepath = os.path.join(output_dir, filename)
-            size_kb = os.path.getsize(filepath) / 1024
-            presentations.append(
-                {"filename": filename, "size_kb": round(size_kb, 1), "path": filepath}
-            )
+        entries.sort(key=lambda e: e.name)
+        presentations = [
+            {
+                "filename": e.name,
+                "size_kb": round(e.stat().st_size / 1024, 1),
+                "path": e.path,
+            }
+            for e in entries
+        ]
 
-        result_message = f"Found {len(pptx_files)} presentation(s) in {output_dir}:\n"
-        for i, pres in enumerate(presentations, 1):
-            result_message += f"\n{i}. {pres['filename']} ({pres['size_kb']} KB)"
+        # Accumulate lines and join once - += string building is
+        # quadratic in CPython once the string has multiple references
+        parts = [f"Found {len(presentations)} presentation(s) in {output_dir}:\n"]
+        parts.extend(
+            f"{i}. {pres['filename']} ({pres['size_kb']} KB)"
+            for i, pres in enumerate(presentations, 1)
+        )
+        result_message = "\n".join(parts)
 
         return {
             "success": True,
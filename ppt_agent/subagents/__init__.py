@@ -0,0 +1,10 @@
+"""Sub-agents invoked as tools by the main PowerPoint agent.
+
+Each sub-agent is a self-contained LangGraph agent wrapped in a
+lightweight tool so the main agent can delegate specialized work
+(e.g. web research) without carrying its implementation in context.
+"""
+
+from .research_agent import research_subagent_batch_tool, research_subagent_tool
+
+__all__ = ["research_subagent_batch_tool", "research_subagent_tool"]
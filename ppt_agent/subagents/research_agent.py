@@ -0,0 +1,367 @@
+"""Research sub-agent powered by Tavily web search.
+
+This sub-agent handles web research for presentation content. The main
+agent delegates to it through the research_subagent_tool wrapper, so the
+research loop (search, synthesize, format findings) runs outside the
+main agent's context window.
+
+Environment variables are loaded from .env file in the project root
+(TAVILY_API_KEY is required for searches).
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from langchain_core.tools import StructuredTool, tool
+
+
+# .env loading is deferred to first use (see _load_env) so importing
+# this module - e.g. transitively via ppt_agent.agent - does no disk IO
+project_root = Path(__file__).parent.parent.parent
+env_path = project_root / ".env"
+
+_ENV_LOADED = False
+
+
+def _load_env():
+    """Load project .env once, on the first research call that needs it.
+
+    Skipped entirely when TAVILY_API_KEY is already set (containers, CI),
+    saving both the dotenv import and the filesystem read.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        if not os.environ.get("TAVILY_API_KEY") and env_path.exists():
+            from dotenv import load_dotenv
+
+            load_dotenv(dotenv_path=env_path)
+        _ENV_LOADED = True
+
+
+# System prompt that defines the research sub-agent's role
+RESEARCH_AGENT_PROMPT = """You are a research assistant that gathers facts for presentations.
+
+## Your Approach
+
+1. **Search the Web**: Use tavily_news for current-events queries (a year like 2024/2025/2026,
+   or words like "recent", "current", "trends", "news"); use tavily_facts for everything else.
+   Only call tavily_visuals when the request explicitly asks for images, charts, or other visuals
+2. **Synthesize Findings**: Distill search results into concise, presentation-ready points
+3. **Cite Numbers**: Prefer concrete statistics, dates, and figures over vague statements
+4. **Format for Slides**: Return findings as markdown bullet points grouped under short headers
+
+Keep answers factual and compact - they will be turned into slide content."""
+
+
+# The compiled sub-agent graph is built on first use inside _get_graph.
+# Compiling the StateGraph, constructing the Tavily client, and even
+# importing langchain/langgraph/langchain_tavily are costs nobody
+# should pay for deck runs that never research anything - the langgraph
+# dev server imports every subagent at boot.
+
+
+@lru_cache(maxsize=1)
+def _get_graph():
+    """Build the research sub-agent graph exactly once per process.
+
+    The single TavilySearch instance constructed here is shared by every
+    sub-agent invocation, so all searches in a process go through one
+    underlying Tavily client and reuse its pooled HTTPS connection
+    instead of paying a TCP+TLS handshake per call.
+    """
+    from langchain.agents import create_agent
+    from langchain_openai import ChatOpenAI
+    from langchain_tavily import TavilySearch
+
+    _load_env()
+
+    # Streaming model: final-answer tokens decode incrementally, so the
+    # astream path below can surface them as they arrive instead of
+    # waiting for the full completion. Built once per process alongside
+    # the graph; the byte-identical system-prompt prefix across calls is
+    # what lets OpenAI's automatic prompt caching reuse the prefix KV
+    # cache, so keep RESEARCH_AGENT_PROMPT static.
+    model = ChatOpenAI(model="gpt-5-nano", streaming=True)
+
+    # Three search surfaces so the lean one is the default: facts-only
+    # responses skip image URLs and the Tavily-generated answer, which
+    # otherwise flow into the model's context on every search turn. The
+    # heavier visuals variant is prompt-gated to requests that actually
+    # ask for imagery, and the news tier trades breadth for recency on
+    # current-events queries so fewer reasoning loops are spent sifting
+    # stale general results.
+    tavily_facts = TavilySearch(
+        name="tavily_facts",
+        max_results=5,
+        include_answer=False,
+        include_images=False,
+        include_raw_content=False,
+    )
+    tavily_news = TavilySearch(
+        name="tavily_news",
+        max_results=5,
+        topic="news",
+        include_answer=False,
+        include_images=False,
+        include_raw_content=False,
+    )
+    tavily_visuals = TavilySearch(
+        name="tavily_visuals",
+        max_results=3,
+        include_answer=False,
+        include_images=True,
+    )
+    # No checkpointer: every research invocation is single-shot (one
+    # user message in, one answer out), so cross-invocation persistence
+    # buys nothing and per-node checkpoint serialization is pure
+    # overhead. In-run state still flows through the graph normally.
+    return create_agent(
+        model=model,
+        tools=[tavily_facts, tavily_news, tavily_visuals],
+        system_prompt=RESEARCH_AGENT_PROMPT,
+    )
+
+
+# Result cache keyed by a digest of the whitespace-normalized query.
+# Research calls cost a Tavily round-trip plus LLM synthesis (seconds),
+# so repeats within the TTL window return instantly instead. Only
+# successful answers are stored - errors always retry. Entries expire
+# on their original deadline (hits do not refresh the TTL), so cached
+# facts never outlive the window no matter how often they are re-asked.
+# Set PPT_AGENT_NO_CACHE=1 to force fresh research when staleness
+# matters; RESEARCH_CACHE_TTL (seconds) and RESEARCH_CACHE_SIZE tune
+# the window and capacity.
+_CACHE_TTL = float(os.environ.get("RESEARCH_CACHE_TTL", 600))
+_CACHE_SIZE = int(os.environ.get("RESEARCH_CACHE_SIZE", 256))
+_RESEARCH_CACHE: dict[str, tuple[float, str]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+# Placeholder strings the main LLM sometimes emits while iterating;
+# none of them is worth a research round-trip
+_TRIVIAL_QUERIES = frozenset({"n/a", "none", "tbd"})
+
+
+def _reject_query(query: str) -> str | None:
+    """Return an error message for queries not worth dispatching.
+
+    Cheap guard before the expensive graph invocation: near-empty or
+    placeholder queries waste a full LLM+Tavily round-trip, and
+    pathologically long ones usually mean slide content got pasted back
+    in as a search query.
+    """
+    q = query.strip()
+    if len(q) < 5 or q.lower() in _TRIVIAL_QUERIES:
+        return "Error: query too short or empty; provide a specific research request."
+    if len(q) > 2000:
+        return "Error: query too long; summarize the research request in a sentence or two."
+    return None
+
+
+def _cache_key(query: str) -> str:
+    """Digest of the query with case and internal whitespace collapsed,
+    so trivially equivalent queries ("2024  Olympics" vs "2024 olympics")
+    share one fixed-size entry."""
+    normalized = " ".join(query.lower().split())
+    return hashlib.blake2b(normalized.encode()).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    """Return the cached answer for key, dropping it if expired."""
+    with _CACHE_LOCK:
+        entry = _RESEARCH_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, answer = entry
+        if time.monotonic() >= expires_at:
+            del _RESEARCH_CACHE[key]
+            return None
+        return answer
+
+
+def _cache_put(key: str, answer: str) -> None:
+    """Store an answer, evicting oldest entries past RESEARCH_CACHE_SIZE."""
+    with _CACHE_LOCK:
+        while len(_RESEARCH_CACHE) >= _CACHE_SIZE:
+            del _RESEARCH_CACHE[next(iter(_RESEARCH_CACHE))]
+        _RESEARCH_CACHE[key] = (time.monotonic() + _CACHE_TTL, answer)
+
+
+def _research(query: str) -> str:
+    """Research a topic on the web and return presentation-ready findings.
+
+    Delegates to a specialized research sub-agent that searches the web
+    via Tavily and synthesizes the results into markdown bullet points
+    suitable for slide content.
+
+    Args:
+        query: The research question or topic.
+               Example: "Key statistics about the 2024 Olympics"
+
+    Returns:
+        Markdown-formatted research findings, or an error message if
+        the research failed.
+    """
+    rejection = _reject_query(query)
+    if rejection is not None:
+        return rejection
+
+    cache_key = _cache_key(query)
+    if not os.environ.get("PPT_AGENT_NO_CACHE"):
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    try:
+        result = _get_graph().invoke(
+            {"messages": [{"role": "user", "content": query}]}
+        )
+        final_message = result["messages"][-1]
+        answer = final_message.content
+
+        _cache_put(cache_key, answer)
+        return answer
+
+    except Exception as e:
+        return f"Error during research: {str(e)}"
+
+
+async def _aresearch_one(query: str) -> str:
+    """Async twin of _research, used by the tool's coroutine surface
+    and the batch fan-out."""
+    rejection = _reject_query(query)
+    if rejection is not None:
+        return rejection
+
+    cache_key = _cache_key(query)
+    if not os.environ.get("PPT_AGENT_NO_CACHE"):
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    try:
+        result = await _get_graph().ainvoke(
+            {"messages": [{"role": "user", "content": query}]}
+        )
+        answer = result["messages"][-1].content
+
+        _cache_put(cache_key, answer)
+        return answer
+
+    except Exception as e:
+        return f"Error during research: {str(e)}"
+
+
+# One tool, two surfaces (same pattern as skills.loader.load_skill):
+# sync callers block in invoke, async callers (LangGraph servers, the
+# batch tool) get the ainvoke coroutine on the same streaming graph, so
+# concurrent research calls overlap their decode phases
+research_subagent_tool = StructuredTool.from_function(
+    func=_research,
+    coroutine=_aresearch_one,
+    name="research_subagent_tool",
+)
+
+
+async def _gather_research(queries: list) -> str:
+    """Research all queries with one combined sub-agent invocation.
+
+    One structured prompt covering every uncached topic costs a single
+    sub-agent round-trip (one reasoning loop that can batch its own
+    Tavily calls) instead of N parallel full agent loops - fewer LLM
+    calls and no N-way pressure on the Tavily rate limit. Per-topic
+    sections are split back out of the response so each query still
+    lands in the TTL cache individually.
+    """
+    sections: dict[str, str] = {}
+    pending = []
+    for query in queries:
+        cached = (
+            None
+            if os.environ.get("PPT_AGENT_NO_CACHE")
+            else _cache_get(_cache_key(query))
+        )
+        if cached is not None:
+            sections[query] = cached
+        else:
+            pending.append(query)
+
+    if pending:
+        numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(pending, 1))
+        combined = (
+            "Research each of the following topics separately. Report the findings "
+            "for each topic under a header of the exact form '## Research: <topic>' "
+            "using the topic text verbatim:\n" + numbered
+        )
+        try:
+            result = await _get_graph().ainvoke(
+                {"messages": [{"role": "user", "content": combined}]}
+            )
+            answer = result["messages"][-1].content
+
+            # Map sections back to queries by the header topic the prompt
+            # required verbatim - positional matching would cache findings
+            # under the wrong query whenever the model reorders sections.
+            # Any topic that doesn't match falls back to returning the
+            # combined text unparsed rather than mislabeling it.
+            headers = list(_SECTION_RE.finditer(answer))
+            found = {}
+            for i, header in enumerate(headers):
+                end = headers[i + 1].start() if i + 1 < len(headers) else len(answer)
+                topic = " ".join(header.group("topic").lower().split())
+                found[topic] = answer[header.end():end].strip()
+
+            normalized = {query: " ".join(query.lower().split()) for query in pending}
+            if all(normalized[query] in found for query in pending):
+                for query in pending:
+                    part = found[normalized[query]]
+                    sections[query] = part
+                    _cache_put(_cache_key(query), part)
+            else:
+                combined_sections = "\n\n".join(
+                    f"## Research: {q}\n\n{a}" for q, a in sections.items()
+                )
+                return f"{combined_sections}\n\n{answer}" if sections else answer
+
+        except Exception as e:
+            error = f"Error during research: {str(e)}"
+            for query in pending:
+                sections[query] = error
+
+    return "\n\n".join(
+        f"## Research: {query}\n\n{sections[query]}" for query in queries
+    )
+
+
+# Splits the combined response back into per-topic sections, keeping
+# the header's topic text so sections can be matched to their queries
+_SECTION_RE = re.compile(r"^## Research:\s*(?P<topic>[^\n]*)\n", re.MULTILINE)
+
+
+@tool
+def research_subagent_batch_tool(queries: list[str]) -> str:
+    """Research several topics in one combined request and return all findings.
+
+    Prefer this over repeated research_subagent_tool calls when you need
+    research on two or more subtopics: all topics are researched in a
+    single sub-agent round-trip instead of one per query.
+
+    Args:
+        queries: The research questions or topics, one per subtopic.
+                 Example: ["2024 Olympics medal counts", "2024 Olympics attendance"]
+
+    Returns:
+        Markdown-formatted findings for every query, separated by
+        '## Research: <topic>' headers. Failed queries carry an error
+        message in their section instead of findings.
+    """
+    if not queries:
+        return "No queries provided."
+
+    return asyncio.run(_gather_research(queries))
@@ -10,9 +10,10 @@ are lightweight dispatchers to external implementations.
 
 from langchain_core.tools import tool
 
-# Import external script implementations (not loaded into agent context)
-from ppt_agent.skills.scripts.create_presentation import create_powerpoint
-from ppt_agent.skills.scripts.list_presentations import list_presentations
+# External script implementations are imported inside the tool bodies:
+# create_presentation pulls in python-pptx, which is a meaningful chunk
+# of server cold-start, and neither module is needed until a tool is
+# actually invoked.
 
 
 @tool
@@ -21,6 +22,7 @@ def create_presentation(
     num_slides: int = 5,
     include_title_slide: bool = True,
     output_dir: str = "./output",
+    research_data: str | None = None,
 ) -> str:
     """Create a PowerPoint presentation based on the specified topic and parameters.
 
@@ -36,6 +38,8 @@ def create_presentation(
                            Default is True.
         output_dir: Directory where the PowerPoint file will be saved.
                    Default is "./output". Directory will be created if it doesn't exist.
+        research_data: Optional markdown research findings (e.g. from
+                      research_subagent_tool) used as slide bullet content.
 
     Returns:
         A string message indicating the file path where the presentation was saved,
@@ -45,12 +49,16 @@ def create_presentation(
         >>> create_presentation("AI Trends 2026", num_slides=6)
         "PowerPoint presentation created successfully: ./output/AI_Trends_2026_20260118_143022.pptx"
     """
-    # Call external implementation script (code stays outside agent context)
+    # Call external implementation script (code stays outside agent context,
+    # and python-pptx loads only on first use)
+    from ppt_agent.skills.scripts.create_presentation import create_powerpoint
+
     result = create_powerpoint(
         topic=topic,
         num_slides=num_slides,
         include_title_slide=include_title_slide,
         output_dir=output_dir,
+        research_data=research_data,
     )
 
     return result["message"]
@@ -67,6 +75,8 @@ def list_presentations(output_dir: str = "./output") -> str:
         A formatted string listing all .pptx files found, or a message if none exist.
     """
     # Call external implementation script (code stays outside agent context)
+    from ppt_agent.skills.scripts.list_presentations import list_presentations
+
     result = list_presentations(output_dir=output_dir)
 
     return result["message"]
@@ -4,48 +4,68 @@ This script demonstrates how to invoke the agent locally without
 using the LangGraph dev server.
 """
 
+import concurrent.futures
+
 from langchain_core.messages import HumanMessage
 from ppt_agent.agent import graph
 
 
-def test_agent(prompt: str):
+def test_agent(prompt: str, thread_id: str = "test-thread-1"):
     """Test the agent with a given prompt.
 
     Args:
         prompt: User request for PowerPoint generation
+        thread_id: Conversation thread for this run; concurrent runs
+            must use distinct ids so their state doesn't collide
     """
     print(f"\n{'='*60}")
-    print(f"Testing PowerPoint Agent")
+    print(f"Testing PowerPoint Agent [{thread_id}]")
     print(f"{'='*60}")
     print(f"\nUser Request: {prompt}")
     print(f"\n{'='*60}\n")
 
     # Create a thread configuration
-    config = {"configurable": {"thread_id": "test-thread-1"}}
-
-    # Invoke the agent
-    result = graph.invoke(
-        {"messages": [HumanMessage(content=prompt)]},
-        config=config
-    )
+    config = {"configurable": {"thread_id": thread_id}}
 
-    # Print the response
-    print("Agent Response:")
+    # Stream node updates instead of blocking in invoke: each agent/tool
+    # step prints the moment it finishes (flush=True defeats pipe
+    # buffering), which makes this script a usable latency probe - you
+    # can see where the time goes instead of staring at a black box
+    print("Agent Response (streaming updates):")
     print("-" * 60)
-    for message in result["messages"]:
-        if hasattr(message, "content"):
-            print(f"{message.__class__.__name__}: {message.content}")
+    chunks = []
+    for chunk in graph.stream(
+        {"messages": [HumanMessage(content=prompt)]},
+        config=config,
+        stream_mode="updates",
+    ):
+        for node, update in chunk.items():
+            for message in update.get("messages", []):
+                if hasattr(message, "content"):
+                    print(f"[{node}] {message.__class__.__name__}: {message.content}", flush=True)
+        chunks.append(chunk)
     print("-" * 60)
 
-    return result
+    return chunks
 
 
 if __name__ == "__main__":
-    # Example 1: Create a basic presentation
-    test_agent("Create a 5-slide presentation about Python best practices")
-
-    # Example 2: Custom parameters
-    # test_agent("Generate a 3-slide deck about AI trends in 2026")
+    # Each run is an independent I/O-bound agent invocation, so fan the
+    # examples out over a thread pool: N runs cost roughly the slowest
+    # one instead of the sum. Distinct thread ids keep runs isolated.
+    # Streamed updates from different runs interleave - the [thread-id]
+    # banner and per-update prefixes say which run a line belongs to.
+    prompts = [
+        "Create a 5-slide presentation about Python best practices",
+        # "Generate a 3-slide deck about AI trends in 2026",
+        # "List all the presentations you've created",
+    ]
 
-    # Example 3: List existing presentations
-    # test_agent("List all the presentations you've created")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+        results = list(
+            pool.map(
+                test_agent,
+                prompts,
+                (f"test-thread-{i}" for i in range(1, len(prompts) + 1)),
+            )
+        )
@@ -0,0 +1,92 @@
+"""Query a running LangGraph dev server over the SDK.
+
+Exercises the deployed agent the same way Studio does: list the
+available assistants, then stream a run. Start the server first with
+`langgraph dev` (defaults to http://localhost:2024).
+"""
+
+import argparse
+import asyncio
+import sys
+
+from langgraph_sdk import get_client
+
+# One client for the whole script: langgraph_sdk wraps httpx, so a
+# single long-lived client reuses its pooled connection (one TCP+TLS
+# setup) across every call below instead of re-handshaking per request
+client = get_client(url="http://localhost:2024")
+
+
+async def list_assistants():
+    """Print the assistants registered on the dev server.
+
+    Output is buffered and written once so it cannot interleave with
+    the concurrently running stream consumer.
+    """
+    assistants = await client.assistants.search()
+
+    buf = [f"\n{'='*60}", "Available Assistants", "=" * 60]
+    buf.extend(
+        f"  {assistant['assistant_id']}: {assistant['graph_id']}"
+        for assistant in assistants
+    )
+    sys.stdout.write("\n".join(buf) + "\n")
+
+    return assistants
+
+
+async def test_agent_query(prompt: str, verbose: bool = False):
+    """Stream one agent run for the given prompt.
+
+    Args:
+        prompt: User request for PowerPoint generation
+        verbose: Also render each chunk's payload, not just its event.
+            Payload reprs dominate the logging cost on long streams, so
+            they are skipped by default
+    """
+    thread = await client.threads.create()
+
+    # Buffer chunk lines and flush once at the end: a print per chunk
+    # would block the async consumer on sync stdout IO for every event,
+    # backpressuring the server on high-volume streams
+    buf = [f"\n{'='*60}", "Testing PowerPoint Agent (dev server)", "=" * 60]
+    buf.append(f"\nUser Request: {prompt}\n")
+
+    async for chunk in client.runs.stream(
+        thread["thread_id"],
+        "agent",
+        input={"messages": [{"role": "user", "content": prompt}]},
+    ):
+        if verbose:
+            buf.append(f"[CHUNK] {chunk.event}: {chunk.data}")
+        else:
+            buf.append(f"[CHUNK] {chunk.event}")
+
+    buf.append(f"{'='*60}\n")
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
+async def main(verbose: bool = False):
+    # The assistant listing and the run are independent IO - dispatch
+    # them together so listing overlaps with the stream instead of
+    # delaying it
+    await asyncio.gather(
+        list_assistants(),
+        test_agent_query(
+            "Create a 3-slide presentation about Python best practices",
+            verbose=verbose,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream a test run against the dev server")
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print each chunk's payload, not just its event name",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(verbose=args.verbose))
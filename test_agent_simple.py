@@ -0,0 +1,42 @@
+"""Minimal synchronous smoke test against a running LangGraph dev server.
+
+Blocking counterpart to test_agent_query.py for quick shell checks.
+Start the server first with `langgraph dev`.
+"""
+
+from langgraph_sdk import get_sync_client
+
+# Single module-level client, same reasoning as test_agent_query.py:
+# every call shares one pooled httpx connection
+client = get_sync_client(url="http://localhost:2024")
+
+
+def test_agent_simple(prompt: str):
+    """Run one agent request synchronously and print the final messages.
+
+    Args:
+        prompt: User request for PowerPoint generation
+    """
+    print(f"\n{'='*60}")
+    print("Simple sync test (dev server)")
+    print(f"{'='*60}")
+    print(f"\nUser Request: {prompt}\n")
+
+    thread = client.threads.create()
+    result = client.runs.wait(
+        thread["thread_id"],
+        "agent",
+        input={"messages": [{"role": "user", "content": prompt}]},
+    )
+
+    print("Agent Response:")
+    print("-" * 60)
+    for message in result["messages"]:
+        print(f"{message['type']}: {message.get('content', '')}")
+    print("-" * 60)
+
+    return result
+
+
+if __name__ == "__main__":
+    test_agent_simple("List all the presentations you've created")